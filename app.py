@@ -16,7 +16,7 @@ from services import (
     decision_service, notification_service, autofill_service
 )
 from functools import wraps
-from services.ai_analysis_engine import CasaFlowAIAnalyzer
+from services.ai_analysis_engine import analyzer
 from decimal import Decimal
 
 # PDF Generation imports
@@ -1825,10 +1825,7 @@ def analyze_application():
             'has_existing_mortgage': request.form.get('has_existing_mortgage') == 'True'
         }
         
-        # Initialize AI analyzer
-        analyzer = CasaFlowAIAnalyzer()
-        
-        # Perform analysis
+        # Perform analysis with the shared analyzer instance
         analysis = analyzer.analyze_application(application_data)
         
         return jsonify({
@@ -1,5 +1,7 @@
 # models.py
 
+import json
+
 from flask_sqlalchemy import SQLAlchemy
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
@@ -104,6 +106,30 @@ class Admin(db.Model):
         """Check password against hash"""
         return check_password_hash(self.password_hash, password)
 
+class AIAnalysisReport(db.Model):
+    # One report per application, keyed by application_id so lookups and
+    # upserts go straight through the primary key
+    application_id = db.Column(db.String(20), db.ForeignKey('application.id'), primary_key=True)
+    rejection_reasons = db.Column(db.Text)      # JSON list of reason dicts
+    recommendations = db.Column(db.Text)        # JSON list of recommendation dicts
+    alternative_offers = db.Column(db.Text)     # JSON list of offer dicts
+    financial_health_score = db.Column(db.Integer)
+    generated_explanation = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def set_rejection_reasons(self, reasons):
+        """Store rejection reasons as JSON"""
+        self.rejection_reasons = json.dumps(reasons)
+
+    def set_recommendations(self, recommendations):
+        """Store recommendations as JSON"""
+        self.recommendations = json.dumps(recommendations)
+
+    def set_alternative_offers(self, offers):
+        """Store alternative offers as JSON"""
+        self.alternative_offers = json.dumps(offers)
+
 class EMI(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     application_id = db.Column(db.String(20), db.ForeignKey('application.id'), nullable=False)
@@ -1,17 +1,273 @@
 import json
-from datetime import datetime
-from decimal import Decimal
+from bisect import bisect_right
+from datetime import date
+from math import nextafter
+from operator import itemgetter
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+# EMI annuity factor for the fixed 8.5% / 60 month product, folded to
+# constants so the affordability check is just multiplies and compares
+_MONTHLY_RATE = 0.085 / 12
+_POW_N = (1 + _MONTHLY_RATE) ** 60
+_EMI_FACTOR = _MONTHLY_RATE * _POW_N / (_POW_N - 1)
+_INV_EMI_FACTOR = 1.0 / _EMI_FACTOR
+
+# Static reason/recommendation/offer templates, hoisted so the per-check
+# hot path only fills in the dynamic fields. Use-sites copy into plain
+# dicts because analyses are serialized to JSON downstream.
+_REASON_NO_CREDIT_HISTORY = MappingProxyType({
+    'factor': 'Credit History',
+    'severity': 'High',
+    'description': 'Unable to verify credit history or insufficient credit data',
+    'impact': 'Cannot assess repayment behavior'
+})
+_REC_BUILD_CREDIT = MappingProxyType({
+    'action': 'Build Credit History',
+    'priority': 'High',
+    'description': 'Start with secured credit card and make timely payments',
+    'timeline': '6-12 months'
+})
+_REASON_CREDIT_LOW = MappingProxyType({
+    'factor': 'Credit Score',
+    'severity': 'Medium',
+    'impact': 'Higher risk of default'
+})
+_REC_IMPROVE_CREDIT = MappingProxyType({
+    'action': 'Improve Credit Score',
+    'priority': 'High',
+    'description': 'Pay existing debts on time and reduce credit utilization',
+    'timeline': '3-6 months'
+})
+_REASON_DEBT_BURDEN = MappingProxyType({
+    'factor': 'Debt Burden',
+    'severity': 'High',
+    'description': 'Existing EMI obligations exceed affordable limits',
+    'impact': 'No capacity for additional loan'
+})
+_REASON_AFFORDABILITY = MappingProxyType({
+    'factor': 'Loan Affordability',
+    'severity': 'Medium',
+    'impact': 'High debt burden ratio'
+})
+_OFFER_REDUCED_LOAN = MappingProxyType({
+    'type': 'Reduced Loan Amount',
+    'tenure': '60 months',
+    'interest_rate': '8.5%',
+    'reason': 'Better aligned with your income and existing obligations'
+})
+_REASON_LTV = MappingProxyType({
+    'factor': 'Loan-to-Value Ratio',
+    'severity': 'Medium',
+    'impact': 'Higher collateral risk'
+})
+_OFFER_LTV_ADJUSTED = MappingProxyType({
+    'type': 'LTV Adjusted Loan',
+    'reason': 'Maintains healthy loan-to-value ratio'
+})
+_REASON_INCOME_LOW = MappingProxyType({
+    'factor': 'Income Level',
+    'severity': 'Medium',
+    'description': 'Monthly salary below minimum threshold for this loan type',
+    'impact': 'Limited repayment capacity'
+})
+_OFFER_SMALL_PERSONAL = MappingProxyType({
+    'type': 'Smaller Personal Loan',
+    'tenure': '36 months',
+    'purpose': 'Income-based smaller loan',
+    'features': ['Lower amount', 'Shorter tenure']
+})
+_OFFER_CREDIT_BUILDER = MappingProxyType({
+    'type': 'Credit Builder Loan',
+    'amount': 50000,
+    'tenure': '12 months',
+    'interest_rate': '12%',
+    'purpose': 'Build credit history',
+    'features': ['Low amount', 'Short tenure', 'Credit reporting']
+})
+_OFFER_PREFERRED_CUSTOMER = MappingProxyType({
+    'type': 'Preferred Customer Loan',
+    'tenure': '84 months',
+    'interest_rate': '7.5%',
+    'features': ['Lower interest', 'Longer tenure', 'Flexible repayment']
+})
+
+# Deferred description templates: checks record ('template', args) under
+# a '_desc' key and _resolve_descriptions formats them only when a
+# narrative (explanation/report) is actually rendered, so callers that
+# consume just status/score never pay for the string building
+_DESC_CREDIT_LOW = 'CIBIL score of {} below minimum requirement of {}'
+_DESC_AFFORDABILITY = 'Requested loan EMI (₹{:.0f}) exceeds affordable limit (₹{:.0f})'
+_DESC_LTV = 'LTV ratio of {:.1%} exceeds maximum allowed {:.1%}'
+
+
+def _resolve_descriptions(reasons):
+    for reason in reasons:
+        desc = reason.pop('_desc', None)
+        if desc is not None:
+            reason['description'] = desc[0].format(*desc[1])
+
+# (day ordinal, formatted date) so report generation only pays for
+# strftime once per day, not once per report
+_TODAY_CACHE = (0, '')
+
+
+def _today_str():
+    global _TODAY_CACHE
+    today = date.today()
+    if today.toordinal() != _TODAY_CACHE[0]:
+        _TODAY_CACHE = (today.toordinal(), today.strftime('%Y-%m-%d'))
+    return _TODAY_CACHE[1]
+
+# (has_critical, has_high, has_any_reason) -> (status, risk_level)
+_FINAL_STATUS = {
+    (True, True, True): ('REJECTED', 'VERY_HIGH'),
+    (True, False, True): ('REJECTED', 'VERY_HIGH'),
+    (False, True, True): ('REJECTED', 'HIGH'),
+    (False, False, True): ('UNDER_REVIEW', 'MEDIUM'),
+    (False, False, False): ('APPROVED', 'LOW')
+}
+
+
+# Score-ladder buckets: thresholds sorted ascending, delta picked by
+# bisect_right(thresholds, value). Strictly-greater boundaries (dti > 0.6,
+# ltv > 0.9) are nudged one ulp up so equality stays in the lower bucket,
+# matching the original comparison ladder exactly.
+_CIBIL_THRESH = (600, 700, 750, 800)
+_CIBIL_DELTA = (-20, 0, 10, 20, 30)
+_SALARY_THRESH = (30000, 50000, 100000)
+_SALARY_DELTA = (-10, 10, 15, 20)
+_DTI_THRESH = (0.2, 0.4, nextafter(0.6, 1.0))
+_DTI_DELTA = (15, 10, 0, -15)
+_LTV_THRESH = (0.6, 0.8, nextafter(0.9, 1.0))
+_LTV_DELTA = (15, 10, 0, -10)
+
+
+def _score_core(cibil, salary, emi, loan, pv, is_non_ag, is_rented):
+    """Pure-numeric financial health score (0-100)"""
+    score = 50  # Base score
+
+    # CIBIL Score contribution (0-30 points)
+    score += _CIBIL_DELTA[bisect_right(_CIBIL_THRESH, cibil)]
+
+    # Income stability (0-20 points)
+    score += _SALARY_DELTA[bisect_right(_SALARY_THRESH, salary)]
+
+    # Debt-to-Income ratio (0-15 points)
+    if salary > 0:
+        score += _DTI_DELTA[bisect_right(_DTI_THRESH, emi / salary)]
+
+    # Loan-to-Value ratio (0-15 points)
+    if pv > 0:
+        score += _LTV_DELTA[bisect_right(_LTV_THRESH, loan / pv)]
+
+    # Property type bonus (0-10 points)
+    if is_non_ag:
+        score += 10
+
+    # Residence stability (0-10 points)
+    if not is_rented:
+        score += 10
+
+    return max(0, min(100, score))
+
+
+if _NUMBA_AVAILABLE:
+    # bisect is not nopython-compatible; the jitted twin keeps the explicit
+    # comparison ladder, which compiles to native branches anyway
+    def _score_core_branches(cibil, salary, emi, loan, pv, is_non_ag, is_rented):
+        score = 50
+
+        if cibil >= 800:
+            score += 30
+        elif cibil >= 750:
+            score += 20
+        elif cibil >= 700:
+            score += 10
+        elif cibil < 600:
+            score -= 20
+
+        if salary >= 100000:
+            score += 20
+        elif salary >= 50000:
+            score += 15
+        elif salary >= 30000:
+            score += 10
+        else:
+            score -= 10
+
+        if salary > 0:
+            dti_ratio = emi / salary
+            if dti_ratio < 0.2:
+                score += 15
+            elif dti_ratio < 0.4:
+                score += 10
+            elif dti_ratio > 0.6:
+                score -= 15
+
+        if pv > 0:
+            ltv_ratio = loan / pv
+            if ltv_ratio < 0.6:
+                score += 15
+            elif ltv_ratio < 0.8:
+                score += 10
+            elif ltv_ratio > 0.9:
+                score -= 10
+
+        if is_non_ag:
+            score += 10
+
+        if not is_rented:
+            score += 10
+
+        return max(0, min(100, score))
+
+    # Explicit signature forces compilation at import time instead of first call
+    _score_core = njit(
+        'int64(float64, float64, float64, float64, float64, boolean, boolean)',
+        cache=True
+    )(_score_core_branches)
+
+    @njit(parallel=True, cache=True)
+    def score_batch(cibil, salary, emi, loan, pv, is_non_ag, is_rented, out):
+        """Score a whole applicant batch into a preallocated out array, one row per core"""
+        for i in prange(cibil.shape[0]):
+            out[i] = _score_core(cibil[i], salary[i], emi[i], loan[i], pv[i],
+                                 is_non_ag[i], is_rented[i])
+        return out
+else:
+    def score_batch(cibil, salary, emi, loan, pv, is_non_ag, is_rented, out):
+        """Score a whole applicant batch into a preallocated out array"""
+        for i in range(cibil.shape[0]):
+            out[i] = _score_core(cibil[i], salary[i], emi[i], loan[i], pv[i],
+                                 is_non_ag[i], is_rented[i])
+        return out
+
 
 class CasaFlowAIAnalyzer:
-    def __init__(self):
-        self.risk_thresholds = {
-            'cibil_min': 750,
-            'salary_to_emi_ratio': 0.5,
-            'loan_to_value_max': 0.8
-        }
-    
-    def analyze_application(self, application_data):
-        """Comprehensive AI analysis of loan application"""
+    # Fixed underwriting thresholds; class-level constants so the checks
+    # read them without a per-instance dict lookup
+    CIBIL_MIN = 750
+    SALARY_EMI_RATIO = 0.5
+    LTV_MAX = 0.8
+    SALARY_MIN = 30000
+
+
+    def analyze_application(self, application_data, include_narrative=True):
+        """Comprehensive AI analysis of loan application
+
+        With include_narrative=False the explanation and rejection
+        descriptions are left unbuilt, for callers that only consume the
+        status/risk/score fields.
+        """
         analysis = {
             'rejection_reasons': [],
             'recommendations': [],
@@ -22,142 +278,186 @@ class CasaFlowAIAnalyzer:
             'risk_level': 'LOW'
         }
         
+        # Unpack the application fields once; every check reads these locals
+        # instead of re-probing the dict
+        cibil_score = application_data.get('cibil_score')
+        monthly_salary = float(application_data.get('monthly_salary', 0) or 0)
+        existing_emi = float(application_data.get('existing_emi', 0) or 0)
+        loan_amount = float(application_data.get('loan_amount', 0) or 0)
+        property_valuation = float(application_data.get('property_valuation', 0) or 0)
+        is_non_agricultural = bool(application_data.get('is_non_agricultural'))
+        is_rented = bool(application_data.get('is_rented'))
+
         # Perform various checks
-        self._check_credit_profile(application_data, analysis)
-        self._check_loan_affordability(application_data, analysis)
-        self._check_loan_to_value_ratio(application_data, analysis)
-        self._check_employment_stability(application_data, analysis)
-        
-        # Generate explanations and alternatives
-        self._generate_explanation(analysis)
-        self._generate_alternative_offers(application_data, analysis)
-        self._calculate_financial_health_score(application_data, analysis)
+        self._check_credit_profile(cibil_score, analysis)
+        self._check_loan_affordability(monthly_salary, existing_emi, loan_amount, analysis)
+        self._check_loan_to_value_ratio(loan_amount, property_valuation, analysis)
+        self._check_employment_stability(monthly_salary, analysis)
+
+        # Generate explanations and alternatives; the explanation pass also
+        # resolves the deferred rejection descriptions
+        if include_narrative:
+            self._generate_explanation(analysis)
+        self._generate_alternative_offers(cibil_score or 0, monthly_salary, analysis)
+        self._calculate_financial_health_score(
+            cibil_score, monthly_salary, existing_emi, loan_amount,
+            property_valuation, is_non_agricultural, is_rented, analysis)
         self._determine_final_status(analysis)
         
         return analysis
-    
-    def _check_credit_profile(self, application_data, analysis):
-        cibil_score = application_data.get('cibil_score')
+
+    def analyze_batch(self, cibil_score, monthly_salary, existing_emi,
+                      loan_amount, property_valuation,
+                      is_non_agricultural=None, is_rented=None):
+        """Vectorized analysis of many applications at once (one array element per applicant)"""
+        cibil = np.asarray(cibil_score, dtype=np.float64)
+        salary = np.asarray(monthly_salary, dtype=np.float64)
+        emi = np.asarray(existing_emi, dtype=np.float64)
+        loan = np.asarray(loan_amount, dtype=np.float64)
+        pv = np.asarray(property_valuation, dtype=np.float64)
+        n = cibil.shape[0]
+        non_ag = (np.zeros(n, dtype=bool) if is_non_agricultural is None
+                  else np.asarray(is_non_agricultural, dtype=bool))
+        rented = (np.zeros(n, dtype=bool) if is_rented is None
+                  else np.asarray(is_rented, dtype=bool))
+
+        # Same checks as analyze_application, as whole-array operations
+        affordable_emi = salary * self.SALARY_EMI_RATIO - emi
+        calculated_emi = loan * _EMI_FACTOR
+        ltv_ratio = np.divide(loan, pv, out=np.zeros(n), where=pv > 0)
+        dti_ratio = np.divide(emi, salary, out=np.zeros(n), where=salary > 0)
+
+        # cibil_score is nullable and NULLs arrive here as NaN, which compares
+        # False against everything; ~(cibil >= ...) keeps NaN rows flagged the
+        # same way the scalar path treats a missing score
+        mask_credit_history = ~(cibil >= 10)
+        mask_credit_score = ~mask_credit_history & (cibil < self.CIBIL_MIN)
+        mask_debt_burden = affordable_emi <= 0
+        mask_affordability = ~mask_debt_burden & (calculated_emi > affordable_emi)
+        mask_ltv = ltv_ratio > self.LTV_MAX
+        mask_income = salary < self.SALARY_MIN
+
+        # High-severity reasons reject outright, any other reason goes to review
+        has_high = mask_credit_history | mask_debt_burden
+        has_any = (has_high | mask_credit_score | mask_affordability |
+                   mask_ltv | mask_income)
+        status = np.select([has_high, has_any], ['REJECTED', 'UNDER_REVIEW'],
+                           default='APPROVED')
+        risk_level = np.select([has_high, has_any], ['HIGH', 'MEDIUM'],
+                               default='LOW')
+
+        # Financial health score ladder as stacked selects
+        score = np.full(n, 50.0)
+        score += np.select([cibil >= 800, cibil >= 750, cibil >= 700, ~(cibil >= 600)],
+                           [30, 20, 10, -20], default=0)
+        score += np.select([salary >= 100000, salary >= 50000, salary >= 30000],
+                           [20, 15, 10], default=-10)
+        score += np.where(salary > 0,
+                          np.select([dti_ratio < 0.2, dti_ratio < 0.4, dti_ratio > 0.6],
+                                    [15, 10, -15], default=0), 0)
+        score += np.where(pv > 0,
+                          np.select([ltv_ratio < 0.6, ltv_ratio < 0.8, ltv_ratio > 0.9],
+                                    [15, 10, -10], default=0), 0)
+        score += np.where(non_ag, 10, 0)
+        score += np.where(rented, 0, 10)
+
+        # Materialize per-applicant rejection factors only for flagged rows
+        rejection_factors = [[] for _ in range(n)]
+        for mask, factor in ((mask_credit_history, 'Credit History'),
+                             (mask_credit_score, 'Credit Score'),
+                             (mask_debt_burden, 'Debt Burden'),
+                             (mask_affordability, 'Loan Affordability'),
+                             (mask_ltv, 'Loan-to-Value Ratio'),
+                             (mask_income, 'Income Level')):
+            for i in np.flatnonzero(mask):
+                rejection_factors[i].append(factor)
+
+        return {
+            'financial_health_score': np.clip(score, 0, 100).astype(np.int64),
+            'status': status,
+            'risk_level': risk_level,
+            'rejection_factors': rejection_factors
+        }
+
+    def analyze_frame(self, df):
+        """Analyze a whole application DataFrame column-wise (SoA layout)"""
+        results = self.analyze_batch(
+            df['cibil_score'].to_numpy(dtype=np.float64),
+            df['monthly_salary'].to_numpy(dtype=np.float64),
+            df['existing_emi'].to_numpy(dtype=np.float64),
+            df['loan_amount'].to_numpy(dtype=np.float64),
+            df['property_valuation'].to_numpy(dtype=np.float64),
+            is_non_agricultural=(df['is_non_agricultural'].to_numpy(dtype=bool)
+                                 if 'is_non_agricultural' in df.columns else None),
+            is_rented=(df['is_rented'].to_numpy(dtype=bool)
+                       if 'is_rented' in df.columns else None)
+        )
+        return pd.DataFrame(results, index=df.index)
+
+    def _check_credit_profile(self, cibil_score, analysis):
         if cibil_score is None or cibil_score < 10:
+            analysis['rejection_reasons'].append(dict(_REASON_NO_CREDIT_HISTORY))
+            analysis['recommendations'].append(dict(_REC_BUILD_CREDIT))
+        elif cibil_score < self.CIBIL_MIN:
             analysis['rejection_reasons'].append({
-                'factor': 'Credit History',
-                'severity': 'High',
-                'description': 'Unable to verify credit history or insufficient credit data',
-                'impact': 'Cannot assess repayment behavior'
-            })
-            analysis['recommendations'].append({
-                'action': 'Build Credit History',
-                'priority': 'High',
-                'description': 'Start with secured credit card and make timely payments',
-                'timeline': '6-12 months'
-            })
-        elif cibil_score < self.risk_thresholds['cibil_min']:
-            analysis['rejection_reasons'].append({
-                'factor': 'Credit Score',
-                'severity': 'Medium',
-                'description': f'CIBIL score of {cibil_score} below minimum requirement of {self.risk_thresholds["cibil_min"]}',
-                'impact': 'Higher risk of default'
-            })
-            analysis['recommendations'].append({
-                'action': 'Improve Credit Score',
-                'priority': 'High',
-                'description': 'Pay existing debts on time and reduce credit utilization',
-                'timeline': '3-6 months'
+                **_REASON_CREDIT_LOW,
+                '_desc': (_DESC_CREDIT_LOW, (cibil_score, self.CIBIL_MIN))
             })
+            analysis['recommendations'].append(dict(_REC_IMPROVE_CREDIT))
 
-    def _check_loan_affordability(self, application_data, analysis):
-        monthly_salary = Decimal(str(application_data.get('monthly_salary', 0)))
-        existing_emi = Decimal(str(application_data.get('existing_emi', 0)))
-        loan_amount = Decimal(str(application_data.get('loan_amount', 0)))
-        
+    def _check_loan_affordability(self, monthly_salary, existing_emi, loan_amount, analysis):
         # Calculate affordable EMI (50% of monthly salary)
-        affordable_emi = monthly_salary * Decimal('0.5')
+        affordable_emi = monthly_salary * self.SALARY_EMI_RATIO
         total_emi_obligation = affordable_emi - existing_emi
         
         if total_emi_obligation <= 0:
-            analysis['rejection_reasons'].append({
-                'factor': 'Debt Burden',
-                'severity': 'High',
-                'description': 'Existing EMI obligations exceed affordable limits',
-                'impact': 'No capacity for additional loan'
-            })
+            analysis['rejection_reasons'].append(dict(_REASON_DEBT_BURDEN))
             return
         
         # Simple EMI calculation (8.5% annual interest, 60 months tenure)
-        interest_rate = Decimal('0.085')
-        tenure_months = 60
-        monthly_interest = interest_rate / 12
-        
-        # EMI formula: P * r * (1+r)^n / ((1+r)^n - 1)
-        principal = loan_amount
-        emi_numerator = principal * monthly_interest * (1 + monthly_interest) ** tenure_months
-        emi_denominator = (1 + monthly_interest) ** tenure_months - 1
-        calculated_emi = emi_numerator / emi_denominator
+        # EMI formula: P * r * (1+r)^n / ((1+r)^n - 1) == P * _EMI_FACTOR
+        calculated_emi = loan_amount * _EMI_FACTOR
         
         if calculated_emi > total_emi_obligation:
             analysis['rejection_reasons'].append({
-                'factor': 'Loan Affordability',
-                'severity': 'Medium',
-                'description': f'Requested loan EMI (₹{calculated_emi:.0f}) exceeds affordable limit (₹{total_emi_obligation:.0f})',
-                'impact': 'High debt burden ratio'
+                **_REASON_AFFORDABILITY,
+                '_desc': (_DESC_AFFORDABILITY, (calculated_emi, total_emi_obligation))
             })
-            
+
             # Calculate suggested loan amount based on affordable EMI
-            suggested_principal = (total_emi_obligation * ((1 + monthly_interest) ** tenure_months - 1))
-            suggested_principal = suggested_principal / (monthly_interest * (1 + monthly_interest) ** tenure_months)
-            
+            suggested_principal = total_emi_obligation * _INV_EMI_FACTOR
+
             analysis['alternative_offers'].append({
-                'type': 'Reduced Loan Amount',
-                'amount': float(suggested_principal),
-                'tenure': '60 months',
-                'emi': float(total_emi_obligation),
-                'interest_rate': '8.5%',
-                'reason': 'Better aligned with your income and existing obligations'
+                **_OFFER_REDUCED_LOAN,
+                'amount': suggested_principal,
+                'emi': total_emi_obligation
             })
 
-    def _check_loan_to_value_ratio(self, application_data, analysis):
-        loan_amount = Decimal(str(application_data.get('loan_amount', 0)))
-        property_valuation = Decimal(str(application_data.get('property_valuation', 0)))
-        
+    def _check_loan_to_value_ratio(self, loan_amount, property_valuation, analysis):
         if property_valuation > 0:
             ltv_ratio = loan_amount / property_valuation
-            
-            if ltv_ratio > self.risk_thresholds['loan_to_value_max']:
+
+            if ltv_ratio > self.LTV_MAX:
                 analysis['rejection_reasons'].append({
-                    'factor': 'Loan-to-Value Ratio',
-                    'severity': 'Medium',
-                    'description': f'LTV ratio of {ltv_ratio:.1%} exceeds maximum allowed {self.risk_thresholds["loan_to_value_max"]:.1%}',
-                    'impact': 'Higher collateral risk'
+                    **_REASON_LTV,
+                    '_desc': (_DESC_LTV, (ltv_ratio, self.LTV_MAX))
                 })
-                
+
                 # Suggest maximum loan amount based on LTV
-                max_loan = property_valuation * Decimal(str(self.risk_thresholds['loan_to_value_max']))
                 analysis['alternative_offers'].append({
-                    'type': 'LTV Adjusted Loan',
-                    'amount': float(max_loan),
-                    'max_ltv': f'{self.risk_thresholds["loan_to_value_max"]:.1%}',
-                    'reason': 'Maintains healthy loan-to-value ratio'
+                    **_OFFER_LTV_ADJUSTED,
+                    'amount': property_valuation * self.LTV_MAX,
+                    'max_ltv': f'{self.LTV_MAX:.1%}'
                 })
 
-    def _check_employment_stability(self, application_data, analysis):
-        monthly_salary = application_data.get('monthly_salary', 0)
-        company_name = application_data.get('company_name', '')
-        
+    def _check_employment_stability(self, monthly_salary, analysis):
         # Simple employment stability check
-        if monthly_salary < 30000:
-            analysis['rejection_reasons'].append({
-                'factor': 'Income Level',
-                'severity': 'Medium',
-                'description': 'Monthly salary below minimum threshold for this loan type',
-                'impact': 'Limited repayment capacity'
-            })
-            
+        if monthly_salary < self.SALARY_MIN:
+            analysis['rejection_reasons'].append(dict(_REASON_INCOME_LOW))
+
             analysis['alternative_offers'].append({
-                'type': 'Smaller Personal Loan',
-                'amount': min(500000, monthly_salary * 10),  # 10x monthly salary
-                'tenure': '36 months',
-                'purpose': 'Income-based smaller loan',
-                'features': ['Lower amount', 'Shorter tenure']
+                **_OFFER_SMALL_PERSONAL,
+                'amount': min(500000, monthly_salary * 10)  # 10x monthly salary
             })
 
     def _generate_explanation(self, analysis):
@@ -169,140 +469,83 @@ class CasaFlowAIAnalyzer:
                 "and excellent creditworthiness. Congratulations!"
             )
             return
-        
-        explanation = "After careful review of your application, here's our assessment:\n\n"
-        
-        for reason in analysis['rejection_reasons']:
-            explanation += f"🔴 {reason['description']} (Severity: {reason['severity']})\n"
-        
+
+        _resolve_descriptions(analysis['rejection_reasons'])
+
+        # Collect fragments and join once instead of rebuilding the string per append
+        parts = ["After careful review of your application, here's our assessment:\n\n"]
+
+        parts.extend(f"🔴 {reason['description']} (Severity: {reason['severity']})\n"
+                     for reason in analysis['rejection_reasons'])
+
         if analysis['recommendations']:
-            explanation += "\n💡 We recommend the following actions:\n"
-            for rec in analysis['recommendations']:
-                explanation += f"• {rec['description']} (Priority: {rec['priority']})\n"
-        
+            parts.append("\n💡 We recommend the following actions:\n")
+            parts.extend(f"• {rec['description']} (Priority: {rec['priority']})\n"
+                         for rec in analysis['recommendations'])
+
         if analysis['alternative_offers']:
-            explanation += "\n🎯 Alternative options available:\n"
-            for offer in analysis['alternative_offers']:
-                explanation += f"• {offer['type']}: ₹{offer['amount']:,.0f}\n"
-        
-        analysis['generated_explanation'] = explanation
+            parts.append("\n🎯 Alternative options available:\n")
+            parts.extend(f"• {offer['type']}: ₹{offer['amount']:,.0f}\n"
+                         for offer in analysis['alternative_offers'])
 
-    def _generate_alternative_offers(self, application_data, analysis):
+        analysis['generated_explanation'] = "".join(parts)
+
+    def _generate_alternative_offers(self, cibil_score, monthly_salary, analysis):
         """Generate alternative loan products based on profile"""
-        monthly_salary = application_data.get('monthly_salary', 0)
-        cibil_score = application_data.get('cibil_score', 0)
-        
         # Credit builder loan for lower scores
         if cibil_score < 700 and monthly_salary > 40000:
-            analysis['alternative_offers'].append({
-                'type': 'Credit Builder Loan',
-                'amount': 50000,
-                'tenure': '12 months',
-                'interest_rate': '12%',
-                'purpose': 'Build credit history',
-                'features': ['Low amount', 'Short tenure', 'Credit reporting']
-            })
-        
+            analysis['alternative_offers'].append(dict(_OFFER_CREDIT_BUILDER))
+
         # Top-up loan for existing customers with good history
         if cibil_score > 750 and monthly_salary > 80000:
             analysis['alternative_offers'].append({
-                'type': 'Preferred Customer Loan',
-                'amount': min(2000000, monthly_salary * 24),
-                'tenure': '84 months',
-                'interest_rate': '7.5%',
-                'features': ['Lower interest', 'Longer tenure', 'Flexible repayment']
+                **_OFFER_PREFERRED_CUSTOMER,
+                'amount': min(2000000, monthly_salary * 24)
             })
 
-    def _calculate_financial_health_score(self, application_data, analysis):
+    def _calculate_financial_health_score(self, cibil_score, monthly_salary,
+                                          existing_emi, loan_amount,
+                                          property_valuation,
+                                          is_non_agricultural, is_rented,
+                                          analysis):
         """Calculate overall financial health score (0-100)"""
-        score = 50  # Base score
-        
-        # CIBIL Score contribution (0-30 points)
-        cibil_score = application_data.get('cibil_score', 0)
-        if cibil_score >= 800:
-            score += 30
-        elif cibil_score >= 750:
-            score += 20
-        elif cibil_score >= 700:
-            score += 10
-        elif cibil_score < 600:
-            score -= 20
-        
-        # Income stability (0-20 points)
-        monthly_salary = application_data.get('monthly_salary', 0)
-        if monthly_salary >= 100000:
-            score += 20
-        elif monthly_salary >= 50000:
-            score += 15
-        elif monthly_salary >= 30000:
-            score += 10
-        else:
-            score -= 10
-        
-        # Debt-to-Income ratio (0-15 points)
-        existing_emi = application_data.get('existing_emi', 0)
-        if monthly_salary > 0:
-            dti_ratio = existing_emi / monthly_salary
-            if dti_ratio < 0.2:
-                score += 15
-            elif dti_ratio < 0.4:
-                score += 10
-            elif dti_ratio > 0.6:
-                score -= 15
-        
-        # Loan-to-Value ratio (0-15 points)
-        loan_amount = application_data.get('loan_amount', 0)
-        property_valuation = application_data.get('property_valuation', 0)
-        if property_valuation > 0:
-            ltv_ratio = loan_amount / property_valuation
-            if ltv_ratio < 0.6:
-                score += 15
-            elif ltv_ratio < 0.8:
-                score += 10
-            elif ltv_ratio > 0.9:
-                score -= 10
-        
-        # Property type bonus (0-10 points)
-        if application_data.get('is_non_agricultural'):
-            score += 10
-        
-        # Residence stability (0-10 points)
-        if not application_data.get('is_rented'):
-            score += 10
-        
-        analysis['financial_health_score'] = max(0, min(100, int(score)))
+        analysis['financial_health_score'] = _score_core(
+            float(cibil_score or 0), monthly_salary, existing_emi,
+            loan_amount, property_valuation, is_non_agricultural, is_rented)
 
     def _determine_final_status(self, analysis):
         """Determine final application status based on analysis"""
         rejection_reasons = analysis['rejection_reasons']
-        
-        # Check for critical rejection reasons
-        critical_reasons = [r for r in rejection_reasons if r['severity'] == 'Critical']
-        high_reasons = [r for r in rejection_reasons if r['severity'] == 'High']
-        
-        if critical_reasons:
-            analysis['status'] = 'REJECTED'
-            analysis['risk_level'] = 'VERY_HIGH'
-        elif high_reasons:
-            analysis['status'] = 'REJECTED'
-            analysis['risk_level'] = 'HIGH'
-        elif rejection_reasons:
-            analysis['status'] = 'UNDER_REVIEW'
-            analysis['risk_level'] = 'MEDIUM'
-        else:
-            analysis['status'] = 'APPROVED'
-            analysis['risk_level'] = 'LOW'
 
-    def generate_detailed_report(self, application_data):
-        """Generate a comprehensive PDF-ready report"""
-        analysis = self.analyze_application(application_data)
-        
+        # Single pass over reasons; a Critical hit decides the outcome outright
+        has_critical = has_high = False
+        for reason in rejection_reasons:
+            severity = reason['severity']
+            if severity == 'Critical':
+                has_critical = True
+                break
+            if severity == 'High':
+                has_high = True
+
+        analysis['status'], analysis['risk_level'] = _FINAL_STATUS[
+            (has_critical, has_high, bool(rejection_reasons))]
+
+    def generate_detailed_report(self, application_data, analysis=None):
+        """Generate a comprehensive PDF-ready report; pass a cached analysis to avoid re-running the checks"""
+        if analysis is None:
+            analysis = self.analyze_application(application_data)
+        elif not analysis['generated_explanation']:
+            # A cached analysis built without narrative still needs its
+            # explanation rendered (which also resolves the deferred
+            # rejection descriptions)
+            self._generate_explanation(analysis)
+
         report = {
             'application_summary': {
                 'applicant_name': f"{application_data.get('first_name', '')} {application_data.get('last_name', '')}",
                 'applied_amount': application_data.get('loan_amount'),
                 'property_value': application_data.get('property_valuation'),
-                'application_date': datetime.now().strftime('%Y-%m-%d')
+                'application_date': _today_str()
             },
             'risk_assessment': {
                 'financial_health_score': analysis['financial_health_score'],
@@ -311,10 +554,14 @@ class CasaFlowAIAnalyzer:
             },
             'key_findings': {
                 'strengths': [],
-                'concerns': [reason['description'] for reason in analysis['rejection_reasons']],
-                'opportunities': [offer['type'] for offer in analysis['alternative_offers']]
+                'concerns': list(map(itemgetter('description'), analysis['rejection_reasons'])),
+                'opportunities': list(map(itemgetter('type'), analysis['alternative_offers']))
             },
             'detailed_analysis': analysis
         }
-        
-        return report
\ No newline at end of file
+
+        return report
+
+# Shared instance; the analyzer carries no per-request state, so callers
+# reuse this instead of constructing their own
+analyzer = CasaFlowAIAnalyzer()
\ No newline at end of file
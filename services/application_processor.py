@@ -18,19 +18,22 @@ class ApplicationProcessor:
             if not application:
                 return {'success': False, 'error': 'Application not found'}
             
-            # Step 1: Perform credit risk assessment
-            credit_risk_result = self.credit_service.calculate_credit_risk(application)
-            
-            # Step 2: Update application with credit risk data
-            self._update_application_risk(application, credit_risk_result)
-            
-            # Step 3: Generate AI analysis report
-            ai_report = self._generate_ai_analysis(application, credit_risk_result)
-            
-            # Step 4: Make final decision
-            decision = self._make_decision(application, credit_risk_result, ai_report)
-            
-            # Step 5: Save all changes
+            # Steps 1-4 only mutate in-memory state; suppress autoflush so
+            # queries issued along the way don't force mid-transaction writes
+            with db.session.no_autoflush:
+                # Step 1: Perform credit risk assessment
+                credit_risk_result = self.credit_service.calculate_credit_risk(application)
+
+                # Step 2: Update application with credit risk data
+                self._update_application_risk(application, credit_risk_result)
+
+                # Step 3: Generate AI analysis report
+                ai_report = self._generate_ai_analysis(application, credit_risk_result)
+
+                # Step 4: Make final decision
+                decision = self._make_decision(application, credit_risk_result, ai_report)
+
+            # Step 5: Save all changes in one write path
             db.session.commit()
             
             return {
@@ -38,14 +41,52 @@ class ApplicationProcessor:
                 'application_id': application_id,
                 'decision': decision,
                 'credit_risk': credit_risk_result,
-                'ai_report_id': ai_report.id if ai_report else None
+                'ai_report_id': ai_report.application_id if ai_report else None
             }
             
         except Exception as e:
-            logger.error(f"Application processing failed: {str(e)}")
+            logger.error("Application processing failed: %s", e)
             db.session.rollback()
             return {'success': False, 'error': str(e)}
     
+    def process_applications(self, application_ids):
+        """
+        Process a batch of queued applications with one fetch and one commit
+        """
+        applications = Application.query.filter(
+            Application.id.in_(application_ids)).all()
+        found_ids = {application.id for application in applications}
+
+        results = []
+        try:
+            with db.session.no_autoflush:
+                for application in applications:
+                    credit_risk_result = self.credit_service.calculate_credit_risk(application)
+                    self._update_application_risk(application, credit_risk_result)
+                    ai_report = self._generate_ai_analysis(application, credit_risk_result)
+                    decision = self._make_decision(application, credit_risk_result, ai_report)
+                    results.append({
+                        'success': True,
+                        'application_id': application.id,
+                        'decision': decision,
+                        'credit_risk': credit_risk_result,
+                        'ai_report_id': ai_report.application_id if ai_report else None
+                    })
+
+            # One flush/commit for the whole batch
+            db.session.commit()
+
+        except Exception as e:
+            logger.error("Batch application processing failed: %s", e)
+            db.session.rollback()
+            return {'success': False, 'error': str(e)}
+
+        results.extend(
+            {'success': False, 'application_id': missing_id, 'error': 'Application not found'}
+            for missing_id in application_ids if missing_id not in found_ids
+        )
+        return {'success': True, 'results': results}
+
     def _update_application_risk(self, application, credit_risk_result):
         """Update application with credit risk information"""
         if credit_risk_result.get('success'):
@@ -68,12 +109,10 @@ class ApplicationProcessor:
     def _generate_ai_analysis(self, application, credit_risk_result):
         """Generate comprehensive AI analysis report"""
         try:
-            # Create or update AI analysis report
-            ai_report = AIAnalysisReport.query.filter_by(application_id=application.id).first()
-            if not ai_report:
-                ai_report = AIAnalysisReport(application_id=application.id)
-                db.session.add(ai_report)
-            
+            # Create or update AI analysis report in one upsert; merge resolves
+            # by primary key (or identity map) instead of a separate SELECT probe
+            ai_report = db.session.merge(AIAnalysisReport(application_id=application.id))
+
             # Generate rejection reasons if any
             rejection_reasons = self._assess_rejection_reasons(application, credit_risk_result)
             ai_report.set_rejection_reasons(rejection_reasons)
@@ -98,7 +137,7 @@ class ApplicationProcessor:
             return ai_report
             
         except Exception as e:
-            logger.error(f"AI analysis generation failed: {str(e)}")
+            logger.error("AI analysis generation failed: %s", e)
             return None
     
     def _assess_rejection_reasons(self, application, credit_risk_result):
@@ -176,20 +215,20 @@ class ApplicationProcessor:
         if not rejection_reasons:
             return "Application meets all criteria. Recommended for approval."
         
-        explanation = "Application analysis completed. Key findings:\n\n"
-        
+        # Collect fragments and join once instead of rebuilding the string per append
+        parts = ["Application analysis completed. Key findings:\n\n"]
+
         if credit_risk_result.get('success'):
-            explanation += f"Credit Risk: {credit_risk_result.get('risk_category')} "
-            explanation += f"(Score: {credit_risk_result.get('risk_score')}/100)\n"
+            parts.append(f"Credit Risk: {credit_risk_result.get('risk_category')} ")
+            parts.append(f"(Score: {credit_risk_result.get('risk_score')}/100)\n")
         else:
-            explanation += "Credit Risk: Assessment Failed - Manual Review Required\n"
-        
+            parts.append("Credit Risk: Assessment Failed - Manual Review Required\n")
+
         if rejection_reasons:
-            explanation += "\nAreas needing improvement:\n"
-            for reason in rejection_reasons:
-                explanation += f"- {reason['description']}\n"
-        
-        return explanation
+            parts.append("\nAreas needing improvement:\n")
+            parts.extend(f"- {reason['description']}\n" for reason in rejection_reasons)
+
+        return "".join(parts)
     
     def _make_decision(self, application, credit_risk_result, ai_report):
         """Make final decision on application"""